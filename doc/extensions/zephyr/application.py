@@ -115,6 +115,11 @@ class ZephyrAppCommandsDirective(Directive):
     TOOLS = ['cmake', 'west', 'all']
     GENERATORS = ['make', 'ninja']
     HOST_OS = ['unix', 'win', 'all']
+    # What 'all' expands to for the tool and host-os options.
+    ALL_TOOLS = [v for v in TOOLS if v != 'all']
+    ALL_HOST_OS = [v for v in HOST_OS if v != 'all']
+    # Goals which map directly to a west command of the same name.
+    WEST_GOALS = frozenset(['flash', 'debug', 'debugserver', 'attach'])
     IN_TREE_STR = '# From the root of the zephyr repository'
 
     def run(self):
@@ -163,11 +168,9 @@ class ZephyrAppCommandsDirective(Directive):
         build_dir = ('build' + '/' + build_dir_append).rstrip('/')
 
         # Create host_os array
-        host_os = [host_os] if host_os != "all" else [v for v in self.HOST_OS
-                                                        if v != 'all']
+        host_os = [host_os] if host_os != "all" else self.ALL_HOST_OS
         # Create tools array
-        tools = [tool] if tool != "all" else [v for v in self.TOOLS
-                                                if v != 'all']
+        tools = [tool] if tool != "all" else self.ALL_TOOLS
         # Build the command content as a list, then convert to string.
         content = []
         tool_comment = None
@@ -272,14 +275,8 @@ class ZephyrAppCommandsDirective(Directive):
         for goal in goals:
             if goal in {'build', 'sign'}:
                 continue
-            elif goal == 'flash':
-                content.append('west flash{}'.format(dst))
-            elif goal == 'debug':
-                content.append('west debug{}'.format(dst))
-            elif goal == 'debugserver':
-                content.append('west debugserver{}'.format(dst))
-            elif goal == 'attach':
-                content.append('west attach{}'.format(dst))
+            elif goal in self.WEST_GOALS:
+                content.append('west {}{}'.format(goal, dst))
             else:
                 content.append('west build -t {}{}'.format(goal, dst))
 
@@ -55,6 +55,9 @@ def create_redirect_pages(app, docname):
     if not isinstance(app.builder, StandaloneHTMLBuilder):
         return  # only relevant for standalone HTML output
 
+    # Many redirects share an output directory; only check each one once.
+    created_dirs = set()
+
     for (old_url, new_url) in app.config.html_redirect_pages:
         if old_url.startswith('/'):
             old_url = old_url[1:]
@@ -64,8 +67,9 @@ def create_redirect_pages(app, docname):
         out_file = app.builder.get_outfilename(old_url)
 
         out_dir = os.path.dirname(out_file)
-        if not os.path.exists(out_dir):
-            os.makedirs(out_dir)
+        if out_dir not in created_dirs:
+            os.makedirs(out_dir, exist_ok=True)
+            created_dirs.add(out_dir)
 
         content = REDIRECT_TEMPLATE.replace("$NEWURL", new_url)
 
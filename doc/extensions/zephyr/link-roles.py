@@ -10,6 +10,9 @@ import re
 from docutils import nodes
 from local_util import run_cmd_get_output
 
+# Matches role text of the form 'link text <target>'.
+LINK_RE = re.compile(r'(.*)\s*<(.*)>')
+
 
 def get_github_rev():
     tag = run_cmd_get_output('git describe --exact-match')
@@ -37,7 +40,7 @@ def setup(app):
 
 def autolink(pattern):
     def role(name, rawtext, text, lineno, inliner, options={}, content=[]):
-        m = re.search(r'(.*)\s*<(.*)>', text)
+        m = LINK_RE.search(text)
         if m:
             link_text = m.group(1)
             link = m.group(2)
@@ -16,6 +16,7 @@
 import argparse
 import collections
 import fnmatch
+import functools
 import os
 from os import path
 import re
@@ -25,6 +26,14 @@ import sys
 # directives to parse for included files
 DIRECTIVES = ["figure", "include", "image", "literalinclude"]
 
+# Matches lines using the directives above. We assume each such
+# directive takes a single argument, which is a (relative) path to the
+# additional dependency file. Applied to the whole file at once, so
+# whitespace matches are kept within a line.
+DIRECTIVE_PATTERN = re.compile(
+    r"^[ \t]*\.\.[ \t]+(?P<directive>%s)::[ \t]+(?P<dep_rel>\S.*)$" %
+    "|".join(DIRECTIVES), re.MULTILINE)
+
 # A simple namedtuple for a generated output file.
 #
 # - src: source file, what file should be copied (in source directory)
@@ -56,10 +65,28 @@ def src_deps(zephyr_base, src_file, dest, src_root):
     if not src_file.endswith(".rst"):
         return []
 
+    # Destination directory for any dependencies.
+    dst_dir = path.join(dest, path.relpath(path.dirname(src_file),
+                                           start=zephyr_base))
+
+    return [Output(dep_src, path.abspath(path.join(dst_dir, dep_rel)))
+            for dep_src, dep_rel in dep_sources(src_file, src_root)]
+
+
+@functools.lru_cache(maxsize=None)
+def dep_sources(src_file, src_root):
+    # Return a tuple of (dep_src, dep_rel) pairs for the additional
+    # dependencies of the .rst file src_file, where dep_src is the
+    # dependency's absolute path and dep_rel is its path relative to
+    # src_file's directory.
+    #
+    # This doesn't depend on the destination, so it's cached: the same
+    # sources are extracted into more than one destination directory.
+
     # Load the file's contents, bailing on decode errors.
     try:
         with open(src_file, encoding="utf-8") as f:
-            content = [x.strip() for x in f.readlines()]
+            content = f.read()
     except UnicodeDecodeError as e:
         # pylint: disable=unsubscriptable-object
         sys.stderr.write(
@@ -71,27 +98,17 @@ def src_deps(zephyr_base, src_file, dest, src_root):
                 e.object[max(e.start - 40, 0):e.end + 40],
                 e.object[e.start:e.end],
                 e.reason))
-        return []
+        return ()
 
     # Source file's directory.
     src_dir = path.dirname(src_file)
-    # Destination directory for any dependencies.
-    dst_dir = path.join(dest, path.relpath(src_dir, start=zephyr_base))
 
     # Find directives in the content which imply additional
-    # dependencies. We assume each such directive takes a single
-    # argument, which is a (relative) path to the additional
-    # dependency file.
-    directives = "|".join(DIRECTIVES)
-    pattern = re.compile(r"\.\.\s+(?P<directive>%s)::\s+(?P<dep_rel>.*)" %
-                         directives)
+    # dependencies.
     deps = []
-    for l in content:
-        m = pattern.match(l)
-        if not m:
-            continue
-
-        dep_rel = m.group('dep_rel')  # relative to src_dir or absolute
+    for m in DIRECTIVE_PATTERN.finditer(content):
+        # relative to src_dir or absolute
+        dep_rel = m.group('dep_rel').rstrip()
         dep_src = path.abspath(path.join(src_dir, dep_rel))
         if path.isabs(dep_rel):
             # Not a relative path, check if it's absolute if we have been
@@ -112,18 +129,21 @@ def src_deps(zephyr_base, src_file, dest, src_root):
                   src_file, file=sys.stderr)
             continue
 
-        dep_dst = path.abspath(path.join(dst_dir, dep_rel))
-        deps.append(Output(dep_src, dep_dst))
+        deps.append((dep_src, dep_rel))
 
-    return deps
+    return tuple(deps)
 
 
-def find_content(zephyr_base, src, dest, fnfilter, ignore, src_root):
-    # Create a list of Outputs to copy over, and new directories we
-    # might need to make to contain them. Don't copy any files or
-    # otherwise modify dest.
-    outputs = []
-    output_dirs = set()
+@functools.lru_cache(maxsize=None)
+def find_sources(zephyr_base, src, fnfilter, ignore):
+    # Return a tuple of (dirpath, sources) pairs, one for each
+    # directory under zephyr_base/src which isn't ignored and contains
+    # files matching fnfilter. sources is the tuple of matching file
+    # names in dirpath.
+    #
+    # Cached, so that each source directory is walked only once even
+    # if its contents are extracted into several destinations.
+    found = []
     for dirpath, dirnames, filenames in os.walk(path.join(zephyr_base, src)):
         # Limit the rest of the walk to subdirectories that aren't ignored.
         dirnames[:] = [d for d in dirnames if not
@@ -131,9 +151,19 @@ def find_content(zephyr_base, src, dest, fnfilter, ignore, src_root):
 
         # If the current directory contains no matching files, keep going.
         sources = fnmatch.filter(filenames, fnfilter)
-        if not sources:
-            continue
+        if sources:
+            found.append((dirpath, tuple(sources)))
+
+    return tuple(found)
+
 
+def find_content(zephyr_base, src, dest, fnfilter, ignore, src_root):
+    # Create a list of Outputs to copy over, and new directories we
+    # might need to make to contain them. Don't copy any files or
+    # otherwise modify dest.
+    outputs = []
+    output_dirs = set()
+    for dirpath, sources in find_sources(zephyr_base, src, fnfilter, ignore):
         # There are sources here; track that the output directory
         # needs to exist.
         dst_dir = path.join(dest, path.relpath(dirpath, start=zephyr_base))
@@ -14,6 +14,7 @@ defined. See the --modules flag.
 import argparse
 import collections
 import errno
+import functools
 from operator import attrgetter
 import os
 import pathlib
@@ -337,13 +338,15 @@ def sym_table_rst(title, syms):
      - Help/prompt
 """.format(title, len(title)*"*")
 
-    for sym in sorted(syms, key=attrgetter("name")):
-        rst += """\
+    # Build the rows as a list and join them once. Index pages can list
+    # thousands of symbols, and repeated += on the RST string is slow.
+    rows = ["""\
    * - :option:`CONFIG_{}`
      - {}
 """.format(sym.name, sym_index_desc(sym))
+            for sym in sorted(syms, key=attrgetter("name"))]
 
-    return rst
+    return rst + "".join(rows)
 
 
 def sym_index_desc(sym):
@@ -427,9 +430,9 @@ def write_dummy_syms_page():
     # they can be referenced from elsewhere in the documentation. This speeds
     # up builds when we don't need the Kconfig symbol documentation.
 
-    rst = ":orphan:\n\nDummy symbols page for turbo mode.\n\n"
-    for sym in kconf.unique_defined_syms:
-        rst += ".. option:: CONFIG_{}\n".format(sym.name)
+    rst = ":orphan:\n\nDummy symbols page for turbo mode.\n\n" + \
+          "".join(".. option:: CONFIG_{}\n".format(sym.name)
+                  for sym in kconf.unique_defined_syms)
 
     write_if_updated("dummy-syms.rst", rst)
 
@@ -504,16 +507,11 @@ def help_rst(sc):
     # Symbols and choices with multiple definitions can have multiple help
     # texts.
 
-    rst = ""
-
-    for node in sc.nodes:
-        if node.help is not None:
-            rst += "Help\n" \
-                   "====\n\n" \
-                   "{}\n\n" \
+    return "".join("Help\n"
+                   "====\n\n"
+                   "{}\n\n"
                    .format(node.help)
-
-    return rst
+                   for node in sc.nodes if node.help is not None)
 
 
 def direct_deps_rst(sc):
@@ -569,14 +567,11 @@ def choice_syms_rst(choice):
     if not choice.syms:
         return ""
 
-    rst = "Choice options\n" \
-          "==============\n\n"
-
-    for sym in choice.syms:
-        # Generates a link
-        rst += "- {}\n".format(expr_str(sym))
-
-    return rst + "\n"
+    # expr_str() generates a link for each symbol
+    return "Choice options\n" \
+           "==============\n\n" + \
+           "".join("- {}\n".format(expr_str(sym)) for sym in choice.syms) + \
+           "\n"
 
 
 def select_imply_rst(sym):
@@ -708,6 +703,7 @@ def kconfig_definition_rst(sc):
     return rst
 
 
+@functools.lru_cache(maxsize=None)
 def choice_id(choice):
     # Returns "choice_<n>", where <n> is the index of the choice in the Kconfig
     # files. The choice that appears first has index 0, the next one index 1,
@@ -717,7 +713,8 @@ def choice_id(choice):
     # filename and in cross-references. Choices (usually) don't have names, so
     # we can't use that, and the prompt isn't guaranteed to be unique.
 
-    # Pretty slow, but fast enough
+    # unique_choices.index() is a linear search, and this is called for every
+    # link to the choice as well, so the result is cached
     return "choice_{}".format(choice.kconfig.unique_choices.index(choice))
 
 
@@ -741,9 +738,13 @@ def choice_desc(choice):
     return desc
 
 
+@functools.lru_cache(maxsize=None)
 def path2module(path):
     # Returns the name of module that 'path' appears in, or None if it does not
     # appear in a module. 'path' is assumed to be relative to 'srctree'.
+    #
+    # Cached, as it's called for every definition location, and the same few
+    # Kconfig files define most symbols.
 
     # Have to be careful here so that e.g. foo/barbaz/qaz isn't assumed to be
     # part of a module with path foo/bar/. Play it safe with pathlib.
@@ -761,10 +762,13 @@ def path2module(path):
     return None
 
 
+@functools.lru_cache(maxsize=None)
 def strip_module_path(path):
     # If 'path' is within a module, strips the module path from it, and adds a
     # '<module name>/' prefix. Otherwise, returns 'path' unchanged. 'path' is
     # assumed to be relative to 'srctree'.
+    #
+    # Cached for the same reason as path2module().
 
     if strip_module_paths:
         abspath = pathlib.Path(kconf.srctree).joinpath(path).resolve()
@@ -21,6 +21,11 @@ import argparse
 import os
 import sys
 import yaml
+try:
+    # Use the C LibYAML parser if available, rather than the Python parser.
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
 import pykwalify.core
 import subprocess
 import re
@@ -61,7 +66,7 @@ mapping:
       - type: str
 '''
 
-schema = yaml.safe_load(METADATA_SCHEMA)
+schema = yaml.load(METADATA_SCHEMA, Loader=SafeLoader)
 
 
 def validate_setting(setting, module_path, filename=None):
@@ -81,7 +86,7 @@ def process_module(module):
 
     if Path(module_yml).is_file():
         with Path(module_yml).open('r') as f:
-            meta = yaml.safe_load(f.read())
+            meta = yaml.load(f.read(), Loader=SafeLoader)
 
         try:
             pykwalify.core.Core(source_data=meta, schema_data=schema)\